@@ -6,7 +6,12 @@ Client library for membranes to interact with the distributed namespace registry
 Provides simple API for registration, discovery, and communication.
 """
 
+import functools
+import hashlib
+import heapq
+import itertools
 import json
+import queue
 import time
 import threading
 import urllib.request
@@ -14,11 +19,218 @@ import urllib.parse
 import logging
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
+from collections import OrderedDict
 import os
 
+# urllib3 is optional - when available, registry traffic reuses pooled
+# keep-alive connections instead of opening a fresh TCP connection per call
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+# httpx is also optional and preferred over urllib3 when present: with
+# HTTP/2 support installed, all heartbeats and discovers from a host are
+# multiplexed as concurrent streams over a single registry connection
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# orjson is optional - its C encoder/decoder is several times faster than
+# stdlib json on the small control-plane payloads these hot paths handle
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+# Shared connection pool for all clients in the process (one socket set per
+# registry host instead of a handshake per heartbeat/discover/register call)
+_http_pool = None
+_http_pool_lock = threading.Lock()
+
+def _get_http_pool():
+    """Get or create the shared urllib3 connection pool"""
+    global _http_pool
+    if _http_pool is None:
+        with _http_pool_lock:
+            if _http_pool is None:
+                _http_pool = urllib3.PoolManager(
+                    num_pools=4, maxsize=16, block=False,
+                    headers={"Content-Type": "application/json",
+                             "Connection": "keep-alive"}
+                )
+    return _http_pool
+
+_httpx_client = None
+
+def _get_httpx_client():
+    """Get or create the shared httpx client (HTTP/2 when h2 is installed)"""
+    global _httpx_client
+    if _httpx_client is None:
+        with _http_pool_lock:
+            if _httpx_client is None:
+                limits = httpx.Limits(max_keepalive_connections=8, max_connections=16)
+                try:
+                    _httpx_client = httpx.Client(http2=True, limits=limits, timeout=10.0)
+                except ImportError:
+                    # h2 not installed - still benefit from the pooled client
+                    _httpx_client = httpx.Client(limits=limits, timeout=10.0)
+    return _httpx_client
+
+class _HeartbeatScheduler:
+    """Shared heartbeat timer for all clients in the process
+
+    One daemon thread services a min-heap of (deadline, client) entries,
+    waking only when the nearest heartbeat is due. This keeps thread count
+    at O(1) no matter how many membranes a process hosts, instead of one
+    sleeping worker thread (and its stack) per registered client.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap: list = []  # (deadline, seq, client)
+        self._active: set = set()
+        self._seq = 0
+        self._thread = None
+
+    def add(self, client):
+        """Schedule periodic heartbeats for a client"""
+        with self._cond:
+            if client in self._active:
+                return
+            self._active.add(client)
+            self._push(client, time.time() + client.heartbeat_interval)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def remove(self, client):
+        """Stop scheduling heartbeats for a client, effective immediately"""
+        with self._cond:
+            self._active.discard(client)
+            # Drop the client's pending entry rather than waiting for its
+            # deadline to lapse, so stopped clients are released right away
+            self._heap = [entry for entry in self._heap if entry[2] is not client]
+            heapq.heapify(self._heap)
+            self._cond.notify()
+
+    def _push(self, client, deadline: float):
+        self._seq += 1
+        heapq.heappush(self._heap, (deadline, self._seq, client))
+
+    def _run(self):
+        while True:
+            due = []
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                now = time.time()
+                # Drain every client already due this tick so co-located
+                # heartbeats can share one request to the registry
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, client = heapq.heappop(self._heap)
+                    if client in self._active:
+                        due.append(client)
+                        self._push(client, now + client.heartbeat_interval)
+                if not due:
+                    # Sleep until the nearest deadline (or until woken by
+                    # an add/remove that may have changed it)
+                    self._cond.wait(self._heap[0][0] - now)
+                    continue
+            self._fire(due)
+
+    def _fire(self, due: list):
+        """Send heartbeats for all due clients, batching per registry"""
+        by_registry: Dict[str, list] = {}
+        for client in due:
+            by_registry.setdefault(client.registry_url, []).append(client)
+
+        for clients in by_registry.values():
+            if len(clients) == 1:
+                self._fire_one(clients[0])
+                continue
+            try:
+                response = clients[0]._post(
+                    "/heartbeat_batch", {"ids": [c.membrane_id for c in clients]})
+                results = response.get("results", {})
+            except Exception as e:
+                # Registry may predate /heartbeat_batch - fall back to the
+                # per-client path so semantics match
+                logger.warning(f"Batch heartbeat failed, falling back: {e}")
+                for client in clients:
+                    self._fire_one(client)
+                continue
+            for client in clients:
+                if not results.get(client.membrane_id, False):
+                    logger.warning(f"Heartbeat rejected for {client.membrane_id}")
+
+    def _fire_one(self, client):
+        try:
+            client.heartbeat()
+        except Exception as e:
+            logger.warning(f"Heartbeat failed for {client.membrane_id}: {e}")
+
+_heartbeat_scheduler = _HeartbeatScheduler()
+
+class _TTLCache:
+    """Bounded LRU cache with per-entry TTL and lazy expiry
+
+    Entries are expired when they are next accessed rather than by a
+    background sweep. Expired entries stay in the table so peek() can
+    compare a refreshed value against the previous one; they are
+    reclaimed when overwritten by set() or by LRU eviction once capacity
+    is reached, so long-lived clients keep a bounded footprint.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key) -> Optional[Any]:
+        """Return a live cached value or None if missing/expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, ttl, value = entry
+        if time.time() >= expires_at:
+            # Keep the stale entry (without LRU promotion) so peek() can
+            # still compare it against the refreshed registration; the
+            # following set() overwrites it, and capacity eviction
+            # reclaims entries that are never refreshed.
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def peek(self, key) -> Optional[tuple]:
+        """Return (value, ttl) even for an expired entry, without promotion"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, ttl, value = entry
+        return value, ttl
+
+    def set(self, key, value, ttl: Optional[float] = None):
+        """Insert or refresh an entry, evicting the LRU entry over capacity"""
+        ttl = self.ttl if ttl is None else ttl
+        self._entries[key] = (time.time() + ttl, ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+@dataclass(slots=True, frozen=True)
 class MembraneEndpoint:
     """Membrane communication endpoint information"""
     id: str
@@ -26,24 +238,64 @@ class MembraneEndpoint:
     communication_mode: str
     metadata: Dict[str, Any]
     last_seen: float
+    last_heartbeat: float = 0.0  # Registry-side heartbeat timestamp
 
 class NamespaceClient:
     """Client for interacting with the namespace registry"""
-    
+
+    # Shared constant so hot paths don't allocate a headers dict per call
+    _JSON_HEADERS = {"Content-Type": "application/json"}
+
+    # Endpoint templates per communication mode; "network" is handled
+    # separately because its endpoint embeds a hashed port
+    _ENDPOINT_TEMPLATES = {
+        "shared-volume": "/opt/membrane/communication/inbox/{id}",
+        "ipc": "/tmp/membrane_{id}.sock",
+    }
+
     def __init__(self, membrane_id: str, registry_url: str = "http://localhost:8765",
                  auto_heartbeat: bool = True, heartbeat_interval: int = 25):
         self.membrane_id = membrane_id
         self.registry_url = registry_url.rstrip('/')
+
+        # Pre-formatted URLs for the registry paths hit on every cycle
+        self._endpoints = {
+            path: f"{self.registry_url}{path}"
+            for path in ("/register", "/deregister", "/heartbeat",
+                         "/heartbeat_batch", "/discover_batch", "/list")
+        }
+
+        # heartbeat() and deregister() post the same body forever - encode
+        # it once instead of on every tick
+        self._id_body = _json_dumps({"id": membrane_id})
+
+        # Per-mode send dispatch (all senders take target, message, timeout)
+        self._senders = {
+            "shared-volume": self._send_shared_volume,
+            "network": self._send_network,
+            "ipc": self._send_ipc,
+        }
         self.auto_heartbeat = auto_heartbeat
         self.heartbeat_interval = heartbeat_interval
         
-        # Heartbeat thread
-        self.heartbeat_thread = None
+        # Heartbeat scheduling state (serviced by the shared scheduler)
         self.heartbeat_running = False
         
-        # Cache for discovered membranes
-        self.membrane_cache: Dict[str, MembraneEndpoint] = {}
-        self.cache_ttl = 60  # Cache entries valid for 60 seconds
+        # Cache for discovered membranes. cache_ttl is only the starting
+        # point: per-entry TTLs adapt between the min/max bounds based on
+        # observed churn (stable membranes are refreshed less often).
+        self.cache_ttl = 60  # Default TTL for new cache entries
+        self.cache_ttl_min = self.cache_ttl / 4
+        self.cache_ttl_max = self.cache_ttl * 8
+        self.membrane_cache = _TTLCache(maxsize=1024, ttl=self.cache_ttl)
+
+        # Target directories already created for shared-volume sends
+        self._known_dirs: set = set()
+        # Per-process sequence making message filenames collision-free
+        self._msg_seq = itertools.count()
+        # Lazily started write-behind queue for async shared-volume sends
+        self._write_q: Optional[queue.Queue] = None
+        self._writer_thread = None
     
     def register(self, parent: Optional[str] = None, endpoint: str = None,
                 communication_mode: str = "shared-volume", metadata: Dict[str, Any] = None) -> bool:
@@ -88,7 +340,7 @@ class NamespaceClient:
             # Stop heartbeat
             self._stop_heartbeat()
             
-            response = self._post("/deregister", {"id": self.membrane_id})
+            response = self._post_raw("/deregister", self._id_body)
             success = response.get("success", False)
             
             if success:
@@ -103,98 +355,193 @@ class NamespaceClient:
     def discover(self, target_membrane_id: str, use_cache: bool = True) -> Optional[MembraneEndpoint]:
         """Discover another membrane by ID"""
         try:
-            # Check cache first if enabled
-            if use_cache and target_membrane_id in self.membrane_cache:
-                cached = self.membrane_cache[target_membrane_id]
-                if time.time() - cached.last_seen < self.cache_ttl:
+            # Check cache first if enabled (expiry is handled by the cache)
+            if use_cache:
+                cached = self.membrane_cache.get(target_membrane_id)
+                if cached is not None:
                     return cached
-            
+
             # Query registry
             response = self._get(f"/discover/{target_membrane_id}")
             
             if response:
-                endpoint = MembraneEndpoint(
-                    id=response["id"],
-                    endpoint=response["endpoint"],
-                    communication_mode=response["communication_mode"],
-                    metadata=response.get("metadata", {}),
-                    last_seen=time.time()
-                )
-                
-                # Update cache
-                self.membrane_cache[target_membrane_id] = endpoint
+                endpoint = self._make_endpoint(response)
+
+                # Update cache with an adapted per-entry TTL
+                self.membrane_cache.set(target_membrane_id, endpoint,
+                                        ttl=self._adapt_ttl(target_membrane_id, endpoint))
                 return endpoint
-            
+
             return None
-            
+
         except Exception as e:
             logger.error(f"Discovery failed for {target_membrane_id}: {e}")
             return None
-    
+
+    def discover_many(self, target_membrane_ids: List[str],
+                      use_cache: bool = True) -> Dict[str, MembraneEndpoint]:
+        """Discover several membranes with a single batched registry call
+
+        Cached, unexpired entries are served locally; the remaining IDs go
+        to the registry in one POST /discover_batch instead of one
+        /discover round-trip each. Returns a mapping of the membranes that
+        were found.
+        """
+        results: Dict[str, MembraneEndpoint] = {}
+        missing: List[str] = []
+
+        for membrane_id in target_membrane_ids:
+            cached = self.membrane_cache.get(membrane_id) if use_cache else None
+            if cached is not None:
+                results[membrane_id] = cached
+            else:
+                missing.append(membrane_id)
+
+        if not missing:
+            return results
+
+        try:
+            response = self._post("/discover_batch", {"ids": missing})
+            for membrane_data in response.get("membranes", []):
+                endpoint = self._make_endpoint(membrane_data)
+                self.membrane_cache.set(endpoint.id, endpoint,
+                                        ttl=self._adapt_ttl(endpoint.id, endpoint))
+                results[endpoint.id] = endpoint
+        except Exception as e:
+            logger.error(f"Batch discovery failed for {missing}: {e}")
+
+        return results
+
     def list_membranes(self, parent: Optional[str] = None, 
                       communication_mode: Optional[str] = None) -> List[MembraneEndpoint]:
         """List membranes with optional filtering"""
         try:
-            params = {}
+            # Hand-rolled query string: with at most two simple params,
+            # urlencode's dict walk and quoting machinery is overkill
+            parts = []
             if parent is not None:
-                params["parent"] = parent
+                parts.append("parent=" + urllib.parse.quote(parent, safe=''))
             if communication_mode is not None:
-                params["communication_mode"] = communication_mode
-            
-            query_string = urllib.parse.urlencode(params)
-            url = f"/list?{query_string}" if query_string else "/list"
-            
+                parts.append("communication_mode=" + urllib.parse.quote(communication_mode, safe=''))
+            url = "/list?" + "&".join(parts) if parts else "/list"
+
             response = self._get(url)
-            
-            endpoints = []
-            for membrane_data in response or []:
-                endpoint = MembraneEndpoint(
-                    id=membrane_data["id"],
-                    endpoint=membrane_data["endpoint"],
-                    communication_mode=membrane_data["communication_mode"],
-                    metadata=membrane_data.get("metadata", {}),
-                    last_seen=time.time()
-                )
-                endpoints.append(endpoint)
-                
-                # Update cache
-                self.membrane_cache[endpoint.id] = endpoint
-            
+
+            # Single pass from decoded records to endpoints, then one cache
+            # update sweep (the decoder already parses the raw bytes without
+            # an intermediate str)
+            endpoints = [self._make_endpoint(m) for m in response or []]
+            for endpoint in endpoints:
+                self.membrane_cache.set(endpoint.id, endpoint,
+                                        ttl=self._adapt_ttl(endpoint.id, endpoint))
+
             return endpoints
-            
+
         except Exception as e:
             logger.error(f"List membranes failed: {e}")
             return []
     
-    def send_message(self, target_membrane_id: str, message: Any, 
-                    timeout: float = 30.0) -> bool:
-        """Send a message to another membrane"""
+    def send_message(self, target_membrane_id: str, message: Any,
+                    timeout: float = 30.0, async_write: bool = False) -> bool:
+        """Send a message to another membrane
+
+        With async_write=True, shared-volume messages are handed to a
+        background writer thread instead of blocking the caller on
+        filesystem I/O; other modes are unaffected.
+        """
         try:
             # Discover target membrane
             target = self.discover(target_membrane_id)
             if not target:
                 logger.error(f"Cannot find target membrane {target_membrane_id}")
                 return False
-            
-            # Route message based on communication mode
-            if target.communication_mode == "shared-volume":
-                return self._send_shared_volume(target, message)
-            elif target.communication_mode == "network":
-                return self._send_network(target, message, timeout)
-            elif target.communication_mode == "ipc":
-                return self._send_ipc(target, message, timeout)
-            else:
-                logger.error(f"Unsupported communication mode: {target.communication_mode}")
-                return False
-                
+
+            if async_write and target.communication_mode == "shared-volume":
+                return self._send_shared_volume(target, message, timeout,
+                                                async_write=True)
+            return self._send_via_mode(target, message, timeout)
+
         except Exception as e:
             logger.error(f"Send message failed to {target_membrane_id}: {e}")
             return False
-    
+
+    def send_messages(self, messages: List[tuple],
+                      timeout: float = 30.0) -> Dict[str, bool]:
+        """Send messages to several membranes with one batched discovery
+
+        messages is a list of (target_membrane_id, payload) pairs. Targets
+        are resolved via discover_many (one registry round-trip for all
+        cache misses), then network sends run concurrently over the shared
+        connection pool while local modes are delivered inline.
+        """
+        targets = self.discover_many([mid for mid, _ in messages])
+        results: Dict[str, bool] = {}
+        network_batch = []
+
+        for membrane_id, payload in messages:
+            target = targets.get(membrane_id)
+            if not target:
+                logger.error(f"Cannot find target membrane {membrane_id}")
+                results[membrane_id] = False
+            elif target.communication_mode == "network":
+                network_batch.append((membrane_id, target, payload))
+            else:
+                results[membrane_id] = self._send_via_mode(target, payload, timeout)
+
+        if network_batch:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(8, len(network_batch))) as executor:
+                futures = {
+                    membrane_id: executor.submit(self._send_network, target, payload, timeout)
+                    for membrane_id, target, payload in network_batch
+                }
+                for membrane_id, future in futures.items():
+                    results[membrane_id] = future.result()
+
+        return results
+
+    def _send_via_mode(self, target: MembraneEndpoint, message: Any,
+                       timeout: float) -> bool:
+        """Route a message to a resolved target by communication mode"""
+        sender = self._senders.get(target.communication_mode)
+        if sender is None:
+            logger.error(f"Unsupported communication mode: {target.communication_mode}")
+            return False
+        return sender(target, message, timeout)
+
+    def _make_endpoint(self, membrane_data: Dict[str, Any]) -> MembraneEndpoint:
+        """Build a MembraneEndpoint from a registry response record"""
+        return MembraneEndpoint(
+            id=membrane_data["id"],
+            endpoint=membrane_data["endpoint"],
+            communication_mode=membrane_data["communication_mode"],
+            metadata=membrane_data.get("metadata", {}),
+            last_seen=time.time(),
+            last_heartbeat=membrane_data.get("last_heartbeat", 0.0)
+        )
+
+    def _adapt_ttl(self, membrane_id: str, endpoint: MembraneEndpoint) -> float:
+        """Choose a cache TTL for a freshly discovered endpoint
+
+        Conditional refresh policy: if the registry returned the same
+        registration we already had cached (same endpoint and mode), the
+        membrane is stable and its TTL is doubled; if the registration
+        changed, the membrane is churny and its TTL is halved.
+        """
+        previous = self.membrane_cache.peek(membrane_id)
+        if previous is None:
+            return self.cache_ttl
+
+        cached, cached_ttl = previous
+        if (cached.endpoint == endpoint.endpoint and
+                cached.communication_mode == endpoint.communication_mode):
+            return min(cached_ttl * 2, self.cache_ttl_max)
+        return max(cached_ttl / 2, self.cache_ttl_min)
+
     def heartbeat(self) -> bool:
         """Send heartbeat to registry"""
         try:
-            response = self._post("/heartbeat", {"id": self.membrane_id})
+            response = self._post_raw("/heartbeat", self._id_body)
             return response.get("success", False)
         except Exception as e:
             logger.warning(f"Heartbeat failed: {e}")
@@ -202,46 +549,86 @@ class NamespaceClient:
     
     def _auto_detect_endpoint(self, communication_mode: str) -> str:
         """Auto-detect communication endpoint based on mode"""
-        if communication_mode == "shared-volume":
-            # Use membrane communication directory
-            return f"/opt/membrane/communication/inbox/{self.membrane_id}"
-        elif communication_mode == "network":
-            # Use localhost with a port derived from membrane ID hash
-            port = 9000 + (hash(self.membrane_id) % 1000)
+        if communication_mode == "network":
+            # Use localhost with a port derived from a stable hash of the
+            # membrane ID. The builtin hash() is PYTHONHASHSEED-randomized,
+            # which would map the same membrane to a new port on every
+            # restart and invalidate any pre-configured routing.
+            digest = hashlib.blake2s(self.membrane_id.encode(), digest_size=2).digest()
+            port = 9000 + (int.from_bytes(digest, "little") % 1000)
             return f"http://localhost:{port}"
-        elif communication_mode == "ipc":
-            # Use Unix socket
-            return f"/tmp/membrane_{self.membrane_id}.sock"
-        else:
-            return f"/opt/membrane/communication/inbox/{self.membrane_id}"
+
+        # Unknown modes fall back to the shared-volume inbox, as before
+        template = self._ENDPOINT_TEMPLATES.get(
+            communication_mode, self._ENDPOINT_TEMPLATES["shared-volume"])
+        return template.format(id=self.membrane_id)
     
-    def _send_shared_volume(self, target: MembraneEndpoint, message: Any) -> bool:
-        """Send message via shared volume"""
+    def _send_shared_volume(self, target: MembraneEndpoint, message: Any,
+                            timeout: float = 30.0, async_write: bool = False) -> bool:
+        """Send message via shared volume (timeout is unused for this mode)"""
         try:
-            import os
-            import json
-            
-            # Create target directory if it doesn't exist
+            # Create target directory once per target, not once per message
             target_dir = target.endpoint
-            os.makedirs(target_dir, exist_ok=True)
-            
-            # Write message to file
-            message_file = f"{target_dir}/msg_{self.membrane_id}_{int(time.time() * 1000)}.json"
+            if target_dir not in self._known_dirs:
+                os.makedirs(target_dir, exist_ok=True)
+                self._known_dirs.add(target_dir)
+
+            # A single clock read feeds both the filename and the payload,
+            # and the sequence suffix keeps same-millisecond messages from
+            # overwriting each other.
+            now_ns = time.time_ns()
+            message_file = (f"{target_dir}/msg_{self.membrane_id}_"
+                            f"{now_ns}_{next(self._msg_seq)}.json")
             message_data = {
                 "sender": self.membrane_id,
-                "timestamp": time.time(),
+                "timestamp": now_ns / 1e9,
                 "payload": message
             }
-            
-            with open(message_file, 'w') as f:
-                json.dump(message_data, f)
-            
+            body = _json_dumps(message_data)
+
+            if async_write:
+                # Hand off to the writer thread; put() blocks when the
+                # queue is full so overload applies backpressure instead
+                # of growing memory without bound
+                self._ensure_writer().put((message_file, body))
+            else:
+                self._write_message_file(message_file, body)
+
             logger.debug(f"Sent message to {target.id} via shared volume: {message_file}")
             return True
-            
+
         except Exception as e:
             logger.error(f"Shared volume send failed: {e}")
             return False
+
+    @staticmethod
+    def _write_message_file(message_file: str, body: bytes):
+        """Write message bytes with a bare open/write/close - one syscall each"""
+        fd = os.open(message_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, body)
+        finally:
+            os.close(fd)
+
+    def _ensure_writer(self) -> queue.Queue:
+        """Start the background shared-volume writer on first use"""
+        if self._write_q is None:
+            self._write_q = queue.Queue(maxsize=4096)
+            self._writer_thread = threading.Thread(target=self._write_worker, daemon=True)
+            self._writer_thread.start()
+            logger.debug("Started shared-volume writer thread")
+        return self._write_q
+
+    def _write_worker(self):
+        """Drain queued shared-volume messages to disk"""
+        while True:
+            message_file, body = self._write_q.get()
+            try:
+                self._write_message_file(message_file, body)
+            except Exception as e:
+                logger.error(f"Async shared volume write failed: {e}")
+            finally:
+                self._write_q.task_done()
     
     def _send_network(self, target: MembraneEndpoint, message: Any, timeout: float) -> bool:
         """Send message via network"""
@@ -252,11 +639,11 @@ class NamespaceClient:
                 "payload": message
             }
             
-            data = json.dumps(message_data).encode()
+            data = _json_dumps(message_data)
             req = urllib.request.Request(
                 f"{target.endpoint}/message",
                 data=data,
-                headers={"Content-Type": "application/json"}
+                headers=self._JSON_HEADERS
             )
             
             with urllib.request.urlopen(req, timeout=timeout) as response:
@@ -273,64 +660,80 @@ class NamespaceClient:
         return False
     
     def _start_heartbeat(self):
-        """Start automatic heartbeat thread"""
+        """Register this client with the shared heartbeat scheduler"""
         if not self.heartbeat_running:
             self.heartbeat_running = True
-            self.heartbeat_thread = threading.Thread(target=self._heartbeat_worker, daemon=True)
-            self.heartbeat_thread.start()
-            logger.debug("Started heartbeat thread")
-    
+            _heartbeat_scheduler.add(self)
+            logger.debug("Scheduled automatic heartbeats")
+
     def _stop_heartbeat(self):
-        """Stop automatic heartbeat thread"""
+        """Unregister this client from the shared heartbeat scheduler"""
         self.heartbeat_running = False
-        if self.heartbeat_thread:
-            self.heartbeat_thread.join(timeout=1.0)
-    
-    def _heartbeat_worker(self):
-        """Background heartbeat worker"""
-        while self.heartbeat_running:
-            try:
-                self.heartbeat()
-                time.sleep(self.heartbeat_interval)
-            except Exception as e:
-                logger.warning(f"Heartbeat worker error: {e}")
-                time.sleep(5)  # Shorter retry interval on error
-    
+        _heartbeat_scheduler.remove(self)
+
+        # Flush any queued shared-volume writes before going quiet
+        if self._write_q is not None:
+            self._write_q.join()
+
     def _post(self, path: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Make HTTP POST request to registry"""
-        url = f"{self.registry_url}{path}"
-        payload = json.dumps(data).encode()
-        
-        req = urllib.request.Request(
-            url,
-            data=payload,
-            headers={"Content-Type": "application/json"}
-        )
-        
+        return self._post_raw(path, _json_dumps(data))
+
+    def _post_raw(self, path: str, payload: bytes) -> Dict[str, Any]:
+        """POST pre-encoded JSON bytes to the registry"""
+        url = self._endpoints.get(path) or f"{self.registry_url}{path}"
+
+        if httpx is not None:
+            response = _get_httpx_client().post(url, content=payload,
+                                                headers=self._JSON_HEADERS)
+            return _json_loads(response.content)
+
+        if urllib3 is not None:
+            response = _get_http_pool().request("POST", url, body=payload, timeout=10)
+            return _json_loads(response.data)
+
+        req = urllib.request.Request(url, data=payload, headers=self._JSON_HEADERS)
+
         with urllib.request.urlopen(req, timeout=10) as response:
-            return json.loads(response.read().decode())
-    
+            return _json_loads(response.read())
+
     def _get(self, path: str) -> Any:
         """Make HTTP GET request to registry"""
-        url = f"{self.registry_url}{path}"
-        
+        url = self._endpoints.get(path) or f"{self.registry_url}{path}"
+
+        if httpx is not None:
+            response = _get_httpx_client().get(url)
+            return _json_loads(response.content)
+
+        if urllib3 is not None:
+            response = _get_http_pool().request("GET", url, timeout=10)
+            return _json_loads(response.data)
+
         with urllib.request.urlopen(url, timeout=10) as response:
-            return json.loads(response.read().decode())
+            return _json_loads(response.read())
+
+_MEMBRANE_CONFIG_PATH = "/opt/membrane/config/membrane.json"
+
+@functools.lru_cache(maxsize=4)
+def _load_membrane_config(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Load a membrane config file, cached until the file changes on disk"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
 
 def create_namespace_client(membrane_id: str = None, registry_url: str = None) -> NamespaceClient:
     """Factory function to create a namespace client with environment-based defaults"""
-    
+
     if membrane_id is None:
         # Try to get membrane ID from environment or config
         membrane_id = os.environ.get("MEMBRANE_ID")
         if not membrane_id:
-            # Try to read from config file
+            # Try to read from config file (one disk read per config change;
+            # the stat keys the cache so edits are picked up)
             try:
-                import json
-                with open("/opt/membrane/config/membrane.json", "r") as f:
-                    config = json.load(f)
-                    membrane_id = config.get("id", "unknown")
-            except:
+                st = os.stat(_MEMBRANE_CONFIG_PATH)
+                config = _load_membrane_config(_MEMBRANE_CONFIG_PATH, st.st_mtime_ns)
+                membrane_id = config.get("id", "unknown")
+            except (OSError, ValueError):
                 membrane_id = "unknown"
     
     if registry_url is None:
@@ -10,6 +10,8 @@ A lightweight distributed registry service that enables membranes to:
 """
 
 import json
+import random
+import re
 import time
 import threading
 import socket
@@ -19,7 +21,8 @@ import urllib.request
 import urllib.parse
 import logging
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 import os
@@ -28,7 +31,55 @@ import os
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+# orjson is optional - its C encoder/decoder takes serialization off the
+# critical path of every HTTP request and state save. Registries installed
+# with stdlib-only python3 fall back to the stdlib json module.
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+# msgspec is optional - when installed on the peer registries, peer-sync
+# payloads travel as MessagePack (smaller and cheaper to decode than JSON
+# for machine-to-machine traffic). JSON remains the wire format otherwise
+# and the receiving side accepts both, keyed on Content-Type.
+# urllib3 is optional - when available, peer propagation reuses pooled
+# keep-alive connections instead of a fresh TCP handshake per event
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+_peer_pool = None
+_peer_pool_lock = threading.Lock()
+
+def _get_peer_pool():
+    """Get or create the shared connection pool for peer registries"""
+    global _peer_pool
+    if _peer_pool is None:
+        with _peer_pool_lock:
+            if _peer_pool is None:
+                _peer_pool = urllib3.PoolManager(
+                    num_pools=64, maxsize=32, retries=False, timeout=5.0)
+    return _peer_pool
+
+try:
+    import msgspec.msgpack
+    _msgpack_encode = msgspec.msgpack.Encoder().encode
+    _msgpack_decode = msgspec.msgpack.Decoder().decode
+except ImportError:
+    _msgpack_encode = None
+    _msgpack_decode = None
+
+@dataclass(slots=True)
 class MembraneInfo:
     """Information about a registered membrane"""
     id: str
@@ -41,30 +92,91 @@ class MembraneInfo:
     last_heartbeat: float
     status: str = "active"  # active, inactive, unhealthy
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict view for serialization
+
+        Unlike dataclasses.asdict this does not recursively deep-copy
+        metadata; the result is handed straight to the JSON encoder, so
+        the copy would be wasted work.
+        """
+        return {name: getattr(self, name) for name in _MEMBRANE_FIELDS}
+
+_MEMBRANE_FIELDS = tuple(f.name for f in fields(MembraneInfo))
+
 class NamespaceRegistry:
     """Distributed namespace registry for P-System membranes"""
     
-    def __init__(self, registry_id: str, port: int = 8765, 
-                 heartbeat_interval: int = 30, cleanup_interval: int = 60):
+    def __init__(self, registry_id: str, port: int = 8765,
+                 heartbeat_interval: int = 30, cleanup_interval: int = 60,
+                 gossip_interval: int = 15):
         self.registry_id = registry_id
         self.port = port
         self.heartbeat_interval = heartbeat_interval
         self.cleanup_interval = cleanup_interval
+        self.gossip_interval = gossip_interval
         
         # Registry state
         self.membranes: Dict[str, MembraneInfo] = {}
         self.peers: Dict[str, str] = {}  # registry_id -> endpoint
         self.lock = threading.RLock()
+
+        # Recently deregistered membranes (id -> deregistration time).
+        # Gossip digests carry these so a peer that missed a delete
+        # cannot resurrect the membrane from its own stale copy; entries
+        # are pruned once old enough that any surviving stale copy would
+        # have been removed by the peer's own cleanup pass.
+        self._tombstones: Dict[str, float] = {}
+        self._tombstone_ttl = heartbeat_interval * 10
+
+        # Read-path snapshots, rebuilt on membership changes while holding
+        # the lock. Readers load one attribute atomically instead of
+        # acquiring the lock, so discover/list scale with handler
+        # concurrency. Heartbeat timestamp updates mutate the shared
+        # MembraneInfo objects in place - a benign race for readers.
+        self._snapshot_by_id: Dict[str, MembraneInfo] = {}
+        self._snapshot_list: tuple = ()
+
+        # Secondary indexes for filtered list queries, rebuilt alongside
+        # the snapshots so filtering is O(|result|) instead of a full scan
+        self._by_parent: Dict[Optional[str], set] = {}
+        self._by_mode: Dict[str, set] = {}
+
+        # Lazily-filled cache of each membrane's encoded JSON, so
+        # discover/list responses are byte joins instead of re-encoding
+        # unchanged membranes on every GET. Entries are dropped on
+        # heartbeat and the whole cache on membership changes.
+        self._json_cache: Dict[str, bytes] = {}
         
         # Background threads
         self.cleanup_thread = None
+        self.flush_thread = None
+        self.gossip_thread = None
         self.running = False
+
+        # Debounce flag for disk writes: mutations set it, a single
+        # flusher thread folds them into the snapshot once per interval,
+        # so the request path never waits on a full-state write
+        self._dirty = threading.Event()
+
+        # Peer propagation runs on a bounded pool so registration latency
+        # is independent of peer count and the slowest peer
+        self._peer_exec = ThreadPoolExecutor(max_workers=16,
+                                             thread_name_prefix="peer-sync")
         
-        # Storage paths
+        # Storage paths. Mutations are appended to a journal (O(1) bytes
+        # per change); the full snapshot is only rewritten on compaction,
+        # instead of re-serializing the entire registry on every event.
         self.state_dir = Path("/opt/membrane/registry")
         self.state_dir.mkdir(parents=True, exist_ok=True)
         self.state_file = self.state_dir / "registry_state.json"
-        
+        self.journal_file = self.state_dir / "journal.jsonl"
+        self._journal = None  # opened lazily on first event
+        self._journal_events = 0
+
+        # Uptime reference for /status; monotonic is fine here because
+        # the value never leaves this process
+        self._start_time = time.monotonic()
+
         # Load persisted state
         self._load_state()
     
@@ -75,6 +187,14 @@ class NamespaceRegistry:
         # Start cleanup thread
         self.cleanup_thread = threading.Thread(target=self._cleanup_worker, daemon=True)
         self.cleanup_thread.start()
+
+        # Start debounced state flusher
+        self.flush_thread = threading.Thread(target=self._flush_worker, daemon=True)
+        self.flush_thread.start()
+
+        # Start gossip anti-entropy worker
+        self.gossip_thread = threading.Thread(target=self._gossip_worker, daemon=True)
+        self.gossip_thread.start()
         
         # Start HTTP server
         server = HTTPRegistryServer(self, port=self.port)
@@ -84,53 +204,74 @@ class NamespaceRegistry:
     def stop(self):
         """Stop the registry service"""
         self.running = False
-        self._save_state()
+        self._compact_journal(force=True)
     
     def register_membrane(self, membrane_info: MembraneInfo) -> bool:
         """Register a membrane in the namespace"""
+        # Wall-clock on purpose: heartbeat timestamps are persisted and
+        # exchanged with peers, where a monotonic reading from another
+        # process would be meaningless. One read covers both fields.
+        now = time.time()
         with self.lock:
-            membrane_info.registered_at = time.time()
-            membrane_info.last_heartbeat = time.time()
+            membrane_info.registered_at = now
+            membrane_info.last_heartbeat = now
             self.membranes[membrane_info.id] = membrane_info
-            
+            self._tombstones.pop(membrane_info.id, None)
+
             logger.info(f"Registered membrane {membrane_info.id} with mode {membrane_info.communication_mode}")
-            self._save_state()
-            
-            # Propagate to peer registries
-            self._propagate_to_peers("register", asdict(membrane_info))
-            return True
-    
+            self._rebuild_snapshot()
+            payload = membrane_info.to_dict()
+            self._append_event("register", payload)
+
+        # Propagate to peer registries outside the lock so peer latency
+        # never serializes registry mutations
+        self._propagate_to_peers("register", payload)
+        return True
+
     def deregister_membrane(self, membrane_id: str) -> bool:
         """Deregister a membrane from the namespace"""
         with self.lock:
-            if membrane_id in self.membranes:
-                del self.membranes[membrane_id]
-                logger.info(f"Deregistered membrane {membrane_id}")
-                self._save_state()
-                
-                # Propagate to peer registries
-                self._propagate_to_peers("deregister", {"id": membrane_id})
-                return True
-            return False
+            if membrane_id not in self.membranes:
+                return False
+            del self.membranes[membrane_id]
+            self._tombstones[membrane_id] = time.time()
+            logger.info(f"Deregistered membrane {membrane_id}")
+            self._rebuild_snapshot()
+            self._append_event("deregister", {"id": membrane_id})
+
+        # Propagate to peer registries outside the lock
+        self._propagate_to_peers("deregister", {"id": membrane_id})
+        return True
     
     def discover_membrane(self, membrane_id: str) -> Optional[MembraneInfo]:
-        """Discover a membrane by ID"""
-        with self.lock:
-            return self.membranes.get(membrane_id)
-    
-    def list_membranes(self, parent: Optional[str] = None, 
+        """Discover a membrane by ID (lock-free snapshot read)"""
+        return self._snapshot_by_id.get(membrane_id)
+
+    def discover_membranes(self, membrane_ids: List[str]) -> List[MembraneInfo]:
+        """Discover several membranes by ID in one call (lock-free)"""
+        snapshot = self._snapshot_by_id
+        return [snapshot[mid] for mid in membrane_ids if mid in snapshot]
+
+    def list_membranes(self, parent: Optional[str] = None,
                       communication_mode: Optional[str] = None) -> List[MembraneInfo]:
-        """List membranes with optional filtering"""
-        with self.lock:
-            membranes = list(self.membranes.values())
-            
-            if parent is not None:
-                membranes = [m for m in membranes if m.parent == parent]
-            
+        """List membranes with optional filtering (lock-free)
+
+        Filters resolve through the secondary indexes, so a filtered
+        query touches only the matching membranes rather than scanning
+        the whole registry.
+        """
+        if parent is None and communication_mode is None:
+            return list(self._snapshot_list)
+
+        snapshot = self._snapshot_by_id
+        if parent is not None:
+            ids = self._by_parent.get(parent, set())
             if communication_mode is not None:
-                membranes = [m for m in membranes if m.communication_mode == communication_mode]
-            
-            return membranes
+                ids = ids & self._by_mode.get(communication_mode, set())
+        else:
+            ids = self._by_mode.get(communication_mode, set())
+
+        return [snapshot[mid] for mid in ids if mid in snapshot]
     
     def heartbeat(self, membrane_id: str) -> bool:
         """Update membrane heartbeat"""
@@ -138,15 +279,88 @@ class NamespaceRegistry:
             if membrane_id in self.membranes:
                 self.membranes[membrane_id].last_heartbeat = time.time()
                 self.membranes[membrane_id].status = "active"
+                self._json_cache.pop(membrane_id, None)
                 return True
             return False
     
+    def heartbeat_batch(self, membrane_ids: List[str]) -> Dict[str, bool]:
+        """Update heartbeats for several membranes in one call"""
+        now = time.time()
+        results = {}
+        with self.lock:
+            for membrane_id in membrane_ids:
+                info = self.membranes.get(membrane_id)
+                if info is not None:
+                    info.last_heartbeat = now
+                    info.status = "active"
+                    self._json_cache.pop(membrane_id, None)
+                    results[membrane_id] = True
+                else:
+                    results[membrane_id] = False
+        return results
+
     def add_peer_registry(self, peer_id: str, endpoint: str):
         """Add a peer registry for distributed operation"""
         with self.lock:
             self.peers[peer_id] = endpoint
             logger.info(f"Added peer registry {peer_id} at {endpoint}")
     
+    def _rebuild_snapshot(self):
+        """Rebuild the read-path snapshots and indexes (call with self.lock held)
+
+        Indexes are rebuilt here rather than updated incrementally at
+        each mutation site so they can never drift from the snapshot;
+        fresh dicts are assigned atomically for the lock-free readers.
+        """
+        self._snapshot_by_id = dict(self.membranes)
+        self._snapshot_list = tuple(self.membranes.values())
+
+        by_parent: Dict[Optional[str], set] = {}
+        by_mode: Dict[str, set] = {}
+        for membrane_id, info in self.membranes.items():
+            by_parent.setdefault(info.parent, set()).add(membrane_id)
+            by_mode.setdefault(info.communication_mode, set()).add(membrane_id)
+        self._by_parent = by_parent
+        self._by_mode = by_mode
+        self._json_cache = {}
+
+    def membrane_json(self, membrane_id: str) -> Optional[bytes]:
+        """Encoded JSON for one membrane, cached until it next changes"""
+        cached = self._json_cache.get(membrane_id)
+        if cached is not None:
+            return cached
+        info = self._snapshot_by_id.get(membrane_id)
+        if info is None:
+            return None
+        encoded = _json_dumps(info.to_dict())
+        self._json_cache[membrane_id] = encoded
+        return encoded
+
+    def list_membranes_json(self, parent: Optional[str] = None,
+                            communication_mode: Optional[str] = None) -> bytes:
+        """Encoded JSON array of membranes, joined from per-membrane cache"""
+        membranes = self.list_membranes(parent, communication_mode)
+        chunks = [self.membrane_json(m.id) for m in membranes]
+        return b"[" + b",".join(c for c in chunks if c is not None) + b"]"
+
+    def apply_peer_update(self, action: str, payload: Dict[str, Any]):
+        """Apply a peer-sync update to local state
+
+        Registers route through merge_membrane so a delayed push obeys
+        the same tombstone and newer-heartbeat rules as gossip - an
+        in-flight register racing a deregister must not resurrect the
+        membrane or clear its tombstone.
+        """
+        if action == "register":
+            self.merge_membrane(payload)
+            return
+        with self.lock:
+            if action == "deregister":
+                self.membranes.pop(payload["id"], None)
+                self._tombstones[payload["id"]] = time.time()
+            self._rebuild_snapshot()
+            self._append_event(action, payload)
+
     def _cleanup_worker(self):
         """Background worker to cleanup stale membranes"""
         while self.running:
@@ -155,75 +369,326 @@ class NamespaceRegistry:
                 current_time = time.time()
                 
                 with self.lock:
-                    stale_membranes = []
+                    # Single pass: no heartbeat for 5x the interval means
+                    # removal, 2x means marked unhealthy
+                    stale_count = 0
+                    removed = []
                     for membrane_id, info in self.membranes.items():
-                        # Consider membrane stale if no heartbeat for 2x the interval
-                        if current_time - info.last_heartbeat > (self.heartbeat_interval * 2):
-                            stale_membranes.append(membrane_id)
+                        age = current_time - info.last_heartbeat
+                        if age > (self.heartbeat_interval * 5):
+                            removed.append(membrane_id)
+                        elif age > (self.heartbeat_interval * 2):
                             info.status = "unhealthy"
-                    
-                    # Remove very old stale membranes (no heartbeat for 5x interval)
-                    for membrane_id, info in list(self.membranes.items()):
-                        if current_time - info.last_heartbeat > (self.heartbeat_interval * 5):
-                            logger.info(f"Removing stale membrane {membrane_id}")
-                            del self.membranes[membrane_id]
-                    
-                    if stale_membranes:
-                        logger.warning(f"Marked {len(stale_membranes)} membranes as unhealthy")
-                        self._save_state()
-                        
+                            stale_count += 1
+
+                    for membrane_id in removed:
+                        logger.info(f"Removing stale membrane {membrane_id}")
+                        del self.membranes[membrane_id]
+                        self._tombstones[membrane_id] = current_time
+                        self._append_event("deregister", {"id": membrane_id})
+
+                    if removed:
+                        self._rebuild_snapshot()
+
+                    if stale_count:
+                        logger.warning(f"Marked {stale_count} membranes as unhealthy")
+
             except Exception as e:
                 logger.error(f"Error in cleanup worker: {e}")
-    
-    def _propagate_to_peers(self, action: str, data: Dict[str, Any]):
-        """Propagate changes to peer registries"""
-        for peer_id, endpoint in self.peers.items():
+
+    def _flush_worker(self):
+        """Debounced snapshot flusher
+
+        Bursts of mutations collapse to one compaction per interval; when
+        nothing changed, the wait times out and no disk write happens.
+        """
+        while self.running:
             try:
-                self._send_to_peer(endpoint, action, data)
+                if self._dirty.wait(timeout=5.0):
+                    self._dirty.clear()
+                    self._compact_journal()
             except Exception as e:
-                logger.warning(f"Failed to propagate to peer {peer_id}: {e}")
+                logger.error(f"Error in flush worker: {e}")
     
-    def _send_to_peer(self, endpoint: str, action: str, data: Dict[str, Any]):
-        """Send data to a peer registry"""
-        payload = json.dumps({"action": action, "data": data}).encode()
-        req = urllib.request.Request(
-            f"{endpoint}/peer-sync",
-            data=payload,
-            headers={"Content-Type": "application/json"}
-        )
-        urllib.request.urlopen(req, timeout=5)
+    def _gossip_worker(self):
+        """Anti-entropy gossip loop
+
+        Every interval, exchange heartbeat digests with a few random
+        peers and pull/push only the entries that differ. Unlike the
+        best-effort per-event push, this bounds sync traffic by the
+        interval rather than the event rate and repairs any update a
+        push dropped while a peer was unreachable.
+        """
+        while self.running:
+            try:
+                time.sleep(self.gossip_interval)
+                peers = list(self.peers.items())
+                if not peers:
+                    continue
+                for peer_id, endpoint in random.sample(peers, min(3, len(peers))):
+                    self._peer_exec.submit(self._gossip_one, peer_id, endpoint)
+            except Exception as e:
+                logger.error(f"Error in gossip worker: {e}")
+
+    def _gossip_one(self, peer_id: str, endpoint: str):
+        """Run one digest exchange with one peer"""
+        try:
+            self._prune_tombstones()
+            digest = {mid: info.last_heartbeat
+                      for mid, info in self._snapshot_by_id.items()}
+            reply = self._post_json(endpoint, "/peer-digest",
+                                    {"digest": digest,
+                                     "tombstones": dict(self._tombstones)})
+
+            # Deletes first, so a tombstoned entry in the same reply
+            # cannot slip through the merge below
+            for mid, deregistered_at in reply.get("tombstones", {}).items():
+                self._apply_tombstone(mid, deregistered_at)
+
+            # Pull: entries the peer has newer than ours
+            for payload in reply.get("updates", []):
+                self.merge_membrane(payload)
+
+            # Push: entries the peer asked for
+            snapshot = self._snapshot_by_id
+            for mid in reply.get("want", []):
+                info = snapshot.get(mid)
+                if info is not None:
+                    payload, content_type = self._encode_peer_message(
+                        "register", info.to_dict())
+                    self._post_bytes(peer_id, endpoint, payload, content_type)
+        except Exception as e:
+            logger.warning(f"Gossip with peer {peer_id} failed: {e}")
+
+    def handle_peer_digest(self, digest: Dict[str, float],
+                           tombstones: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """Answer a peer's digest with our newer entries and a want-list
+
+        The exchange carries deregistration tombstones in both
+        directions: the peer's tombstones are applied before answering,
+        and entries the peer offers are not wanted unless their
+        heartbeat is newer than our own tombstone - otherwise a peer
+        that missed a delete would keep resurrecting the membrane.
+        """
+        for mid, deregistered_at in (tombstones or {}).items():
+            self._apply_tombstone(mid, deregistered_at)
+
+        self._prune_tombstones()
+        snapshot = self._snapshot_by_id
+        local_tombstones = self._tombstones
+        updates = [info.to_dict() for mid, info in snapshot.items()
+                   if digest.get(mid, 0) < info.last_heartbeat]
+        want = [mid for mid, heartbeat in digest.items()
+                if (mid not in snapshot or snapshot[mid].last_heartbeat < heartbeat)
+                and local_tombstones.get(mid, 0) < heartbeat]
+        return {"updates": updates, "want": want,
+                "tombstones": dict(local_tombstones)}
+
+    def merge_membrane(self, payload: Dict[str, Any]):
+        """Merge a gossiped record, keeping whichever heartbeat is newer"""
+        with self.lock:
+            incoming = payload.get("last_heartbeat", 0)
+            if self._tombstones.get(payload["id"], 0) >= incoming:
+                return
+            existing = self.membranes.get(payload["id"])
+            if existing is not None and existing.last_heartbeat >= incoming:
+                return
+            membrane = MembraneInfo(**payload)
+            self.membranes[membrane.id] = membrane
+            self._tombstones.pop(membrane.id, None)
+            self._rebuild_snapshot()
+            self._append_event("register", payload)
+
+    def _apply_tombstone(self, membrane_id: str, deregistered_at: float):
+        """Record a peer's deregistration, dropping any stale local copy"""
+        with self.lock:
+            if deregistered_at > self._tombstones.get(membrane_id, 0):
+                self._tombstones[membrane_id] = deregistered_at
+            info = self.membranes.get(membrane_id)
+            if info is not None and info.last_heartbeat < deregistered_at:
+                del self.membranes[membrane_id]
+                logger.info(f"Removing membrane {membrane_id} tombstoned by peer")
+                self._rebuild_snapshot()
+                self._append_event("deregister", {"id": membrane_id})
+
+    def _prune_tombstones(self):
+        """Drop tombstones old enough that no peer still holds the entry"""
+        cutoff = time.time() - self._tombstone_ttl
+        with self.lock:
+            expired = [mid for mid, ts in self._tombstones.items() if ts < cutoff]
+            for mid in expired:
+                del self._tombstones[mid]
+
+    def _post_json(self, endpoint: str, path: str, obj: Dict[str, Any]) -> Dict[str, Any]:
+        """POST JSON to a peer and decode the JSON reply"""
+        body = _json_dumps(obj)
+        if urllib3 is not None:
+            resp = _get_peer_pool().request(
+                "POST", f"{endpoint}{path}", body=body,
+                headers={"Content-Type": "application/json"})
+            return _json_loads(resp.data)
+
+        req = urllib.request.Request(f"{endpoint}{path}", data=body,
+                                     headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(req, timeout=5) as resp:
+            return _json_loads(resp.read())
+
+    def _propagate_to_peers(self, action: str, data: Dict[str, Any]):
+        """Propagate changes to peer registries (async, best-effort)
+
+        The payload is encoded once and the same bytes are posted to
+        every peer, instead of re-encoding per peer in each worker.
+        """
+        peers = list(self.peers.items())
+        if not peers:
+            return
+        payload, content_type = self._encode_peer_message(action, data)
+        for peer_id, endpoint in peers:
+            self._peer_exec.submit(self._post_bytes, peer_id, endpoint,
+                                   payload, content_type)
+
+    @staticmethod
+    def _encode_peer_message(action: str, data: Dict[str, Any]):
+        """Encode a peer-sync message, preferring msgpack when available"""
+        message = {"action": action, "data": data}
+        if _msgpack_encode is not None:
+            return _msgpack_encode(message), "application/msgpack"
+        return _json_dumps(message), "application/json"
+
+    def _post_bytes(self, peer_id: str, endpoint: str, payload: bytes,
+                    content_type: str):
+        """POST pre-encoded bytes to one peer's /peer-sync, logging failures"""
+        try:
+            if urllib3 is not None:
+                _get_peer_pool().request(
+                    "POST", f"{endpoint}/peer-sync", body=payload,
+                    headers={"Content-Type": content_type})
+                return
+
+            req = urllib.request.Request(
+                f"{endpoint}/peer-sync",
+                data=payload,
+                headers={"Content-Type": content_type}
+            )
+            urllib.request.urlopen(req, timeout=5)
+        except Exception as e:
+            logger.warning(f"Failed to propagate to peer {peer_id}: {e}")
     
     def _load_state(self):
         """Load registry state from disk"""
         try:
             if self.state_file.exists():
-                with open(self.state_file, 'r') as f:
-                    state = json.load(f)
-                    
+                with open(self.state_file, 'rb') as f:
+                    state = _json_loads(f.read())
+
                 # Reconstruct membrane objects
                 for membrane_data in state.get("membranes", []):
                     membrane = MembraneInfo(**membrane_data)
                     self.membranes[membrane.id] = membrane
                 
                 self.peers = state.get("peers", {})
+                self._rebuild_snapshot()
                 logger.info(f"Loaded {len(self.membranes)} membranes from state")
         except Exception as e:
             logger.warning(f"Failed to load state: {e}")
+
+        # Apply any mutations journaled since the snapshot was written
+        self._replay_journal()
+
+    def _append_event(self, action: str, payload: Dict[str, Any]):
+        """Append one mutation to the journal - O(1) bytes per change"""
+        try:
+            if self._journal is None:
+                self._journal = open(self.journal_file, 'ab')
+            self._journal.write(_json_dumps({"action": action, "data": payload}) + b"\n")
+            self._journal.flush()
+            self._journal_events += 1
+            self._dirty.set()
+        except Exception as e:
+            logger.warning(f"Failed to journal event: {e}")
+
+    def _compact_journal(self, force: bool = False):
+        """Fold journaled events into a full snapshot and truncate the journal"""
+        with self.lock:
+            if not force and self._journal_events == 0:
+                return
+            self._save_state()
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            try:
+                self.journal_file.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Failed to truncate journal: {e}")
+            self._journal_events = 0
+
+    def _replay_journal(self):
+        """Replay journaled mutations on top of the loaded snapshot"""
+        try:
+            if not self.journal_file.exists():
+                return
+
+            count = 0
+            with open(self.journal_file, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        event = _json_loads(line)
+                    except ValueError:
+                        # Torn tail write from a crash mid-append
+                        logger.warning("Skipping corrupt journal entry")
+                        continue
+                    action = event.get("action")
+                    payload = event.get("data", {})
+                    if action == "register":
+                        membrane = MembraneInfo(**payload)
+                        self.membranes[membrane.id] = membrane
+                    elif action == "deregister":
+                        self.membranes.pop(payload.get("id"), None)
+                    count += 1
+
+            if count:
+                # Leave the events pending so the next compaction folds
+                # them into the snapshot
+                self._journal_events += count
+                self._rebuild_snapshot()
+                logger.info(f"Replayed {count} journaled events")
+        except Exception as e:
+            logger.warning(f"Failed to replay journal: {e}")
     
     def _save_state(self):
         """Save registry state to disk"""
         try:
             state = {
-                "membranes": [asdict(m) for m in self.membranes.values()],
+                "membranes": [m.to_dict() for m in self.membranes.values()],
                 "peers": self.peers,
                 "saved_at": time.time()
             }
             
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            # No pretty-printing: the file is machine-read and frequently
+            # rewritten, so indentation is pure encode/write overhead.
+            # Write to a temp file and rename over the snapshot so a
+            # crash mid-write never leaves a torn state file behind.
+            tmp = self.state_file.with_suffix(".tmp")
+            with open(tmp, 'wb') as f:
+                f.write(_json_dumps(state))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.state_file)
         except Exception as e:
             logger.warning(f"Failed to save state: {e}")
 
+# Matches /discover/<id>; compiled once rather than re-splitting the
+# path on every GET
+_DISCOVER_RE = re.compile(r"^/discover/([^/?]+)$")
+
+class _RegistryHTTPServer(http.server.ThreadingHTTPServer):
+    """Threaded server so concurrent heartbeats don't queue behind each other"""
+    daemon_threads = True
+    request_queue_size = 256
+
 class HTTPRegistryServer:
     """HTTP server for the namespace registry"""
     
@@ -232,9 +697,14 @@ class HTTPRegistryServer:
         self.port = port
     
     def serve_forever(self):
-        """Start the HTTP server"""
+        """Start the HTTP server
+
+        ThreadingHTTPServer handles each request on its own daemon
+        thread - a plain TCPServer would serialize every heartbeat
+        behind whichever request is currently being parsed.
+        """
         handler = self._create_handler()
-        with socketserver.TCPServer(("", self.port), handler) as httpd:
+        with _RegistryHTTPServer(("", self.port), handler) as httpd:
             logger.info(f"Registry HTTP server listening on port {self.port}")
             httpd.serve_forever()
     
@@ -243,26 +713,28 @@ class HTTPRegistryServer:
         registry = self.registry
         
         class RegistryHandler(http.server.BaseHTTPRequestHandler):
+            # HTTP/1.1 keeps connections open between requests, so a
+            # membrane's heartbeats reuse one warm socket instead of
+            # paying TCP setup per beat. Responses must carry an accurate
+            # Content-Length for this (both send paths below do).
+            protocol_version = "HTTP/1.1"
+
             def do_POST(self):
-                if self.path == "/register":
-                    self._handle_register()
-                elif self.path == "/deregister":
-                    self._handle_deregister()
-                elif self.path == "/heartbeat":
-                    self._handle_heartbeat()
-                elif self.path == "/peer-sync":
-                    self._handle_peer_sync()
+                route = self._POST_ROUTES.get(self.path)
+                if route is not None:
+                    route(self)
                 else:
                     self._send_error(404, "Not Found")
-            
+
             def do_GET(self):
-                if self.path == "/status":
-                    self._handle_status()
-                elif self.path.startswith("/discover/"):
-                    membrane_id = self.path.split("/")[-1]
-                    self._handle_discover(membrane_id)
-                elif self.path == "/list":
-                    self._handle_list()
+                path, _, query = self.path.partition("?")
+                route = self._GET_ROUTES.get(path)
+                if route is not None:
+                    route(self, query)
+                    return
+                match = _DISCOVER_RE.match(path)
+                if match:
+                    self._handle_discover(match.group(1))
                 else:
                     self._send_error(404, "Not Found")
             
@@ -291,53 +763,78 @@ class HTTPRegistryServer:
                 except Exception as e:
                     self._send_error(400, str(e))
             
+            def _handle_heartbeat_batch(self):
+                try:
+                    data = self._read_json()
+                    results = registry.heartbeat_batch(data.get("ids", []))
+                    self._send_json({"results": results})
+                except Exception as e:
+                    self._send_error(400, str(e))
+
+            def _handle_discover_batch(self):
+                try:
+                    data = self._read_json()
+                    membranes = registry.discover_membranes(data.get("ids", []))
+                    chunks = [registry.membrane_json(m.id) for m in membranes]
+                    self._send_json_bytes(
+                        b'{"membranes":['
+                        + b",".join(c for c in chunks if c is not None)
+                        + b"]}")
+                except Exception as e:
+                    self._send_error(400, str(e))
+
             def _handle_discover(self, membrane_id):
                 try:
-                    membrane = registry.discover_membrane(membrane_id)
-                    if membrane:
-                        self._send_json(asdict(membrane))
+                    response = registry.membrane_json(membrane_id)
+                    if response is not None:
+                        self._send_json_bytes(response)
                     else:
                         self._send_error(404, "Membrane not found")
                 except Exception as e:
                     self._send_error(500, str(e))
             
-            def _handle_list(self):
+            def _handle_list(self, query=""):
                 try:
-                    # Parse query parameters
-                    query = urllib.parse.parse_qs(self.path.split("?", 1)[1] if "?" in self.path else "")
-                    parent = query.get("parent", [None])[0]
-                    comm_mode = query.get("communication_mode", [None])[0]
-                    
-                    membranes = registry.list_membranes(parent, comm_mode)
-                    self._send_json([asdict(m) for m in membranes])
+                    params = dict(urllib.parse.parse_qsl(query))
+                    parent = params.get("parent")
+                    comm_mode = params.get("communication_mode")
+
+                    self._send_json_bytes(registry.list_membranes_json(parent, comm_mode))
                 except Exception as e:
                     self._send_error(500, str(e))
-            
-            def _handle_status(self):
+
+            def _handle_status(self, query=""):
                 try:
-                    status = {
+                    self._send_json({
                         "registry_id": registry.registry_id,
                         "membrane_count": len(registry.membranes),
                         "peer_count": len(registry.peers),
-                        "uptime": time.time() - (registry.membranes.get(registry.registry_id, type('obj', (object,), {'registered_at': time.time()})).registered_at)
-                    }
-                    self._send_json(status)
+                        "uptime": time.monotonic() - registry._start_time
+                    })
                 except Exception as e:
                     self._send_error(500, str(e))
             
-            def _handle_peer_sync(self):
+            def _handle_peer_digest(self):
                 try:
                     data = self._read_json()
+                    self._send_json(registry.handle_peer_digest(
+                        data.get("digest", {}), data.get("tombstones", {})))
+                except Exception as e:
+                    self._send_error(400, str(e))
+
+            def _handle_peer_sync(self):
+                try:
+                    if (self.headers.get('Content-Type') == "application/msgpack"
+                            and _msgpack_decode is not None):
+                        content_length = int(self.headers.get('Content-Length', 0))
+                        data = _msgpack_decode(self.rfile.read(content_length))
+                    else:
+                        data = self._read_json()
                     action = data["action"]
                     payload = data["data"]
-                    
-                    if action == "register":
-                        membrane = MembraneInfo(**payload)
-                        registry.membranes[membrane.id] = membrane
-                    elif action == "deregister":
-                        membrane_id = payload["id"]
-                        registry.membranes.pop(membrane_id, None)
-                    
+
+                    registry.apply_peer_update(action, payload)
+
                     self._send_json({"success": True})
                 except Exception as e:
                     self._send_error(400, str(e))
@@ -345,26 +842,51 @@ class HTTPRegistryServer:
             def _read_json(self):
                 content_length = int(self.headers.get('Content-Length', 0))
                 data = self.rfile.read(content_length)
-                return json.loads(data.decode())
-            
+                return _json_loads(data)
+
             def _send_json(self, data):
-                response = json.dumps(data).encode()
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Content-Length', str(len(response)))
-                self.end_headers()
-                self.wfile.write(response)
+                self._send_json_bytes(_json_dumps(data))
+
+            def _send_json_bytes(self, response):
+                # Status line, headers and body assembled into one buffer
+                # and written in a single call - send_response plus each
+                # send_header issues its own small wfile.write
+                self.wfile.write(
+                    self.protocol_version.encode() + b" 200 OK\r\n"
+                    b"Content-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(response)).encode()
+                    + b"\r\n\r\n" + response)
             
             def _send_error(self, code, message):
+                body = message.encode()
                 self.send_response(code)
                 self.send_header('Content-Type', 'text/plain')
+                # Without a Content-Length a keep-alive client would wait
+                # for the connection to close to find the body's end
+                self.send_header('Content-Length', str(len(body)))
                 self.end_headers()
-                self.wfile.write(message.encode())
+                self.wfile.write(body)
             
             def log_message(self, format, *args):
                 # Suppress default HTTP logs to avoid clutter
                 pass
-        
+
+        # Dispatch tables built once at handler creation - exact-path
+        # lookups replace the per-request if/elif chain
+        RegistryHandler._POST_ROUTES = {
+            "/register": RegistryHandler._handle_register,
+            "/deregister": RegistryHandler._handle_deregister,
+            "/heartbeat": RegistryHandler._handle_heartbeat,
+            "/heartbeat_batch": RegistryHandler._handle_heartbeat_batch,
+            "/discover_batch": RegistryHandler._handle_discover_batch,
+            "/peer-sync": RegistryHandler._handle_peer_sync,
+            "/peer-digest": RegistryHandler._handle_peer_digest,
+        }
+        RegistryHandler._GET_ROUTES = {
+            "/status": RegistryHandler._handle_status,
+            "/list": RegistryHandler._handle_list,
+        }
+
         return RegistryHandler
 
 def main():
@@ -17,12 +17,10 @@ echo "Max nesting depth: $MAX_NESTING_DEPTH"
 echo "Visualization enabled: $ENABLE_VISUALIZATION"
 echo "Registry integration: $ENABLE_REGISTRY"
 
-# Create orchestrator directory structure  
-mkdir -p /opt/orchestrator
-mkdir -p /opt/orchestrator/templates
-mkdir -p /opt/orchestrator/configs
-mkdir -p /opt/orchestrator/tools
-mkdir -p /opt/orchestrator/visualizer
+# Create orchestrator directory structure (one mkdir invocation; -p
+# creates /opt/orchestrator itself along the way)
+mkdir -p /opt/orchestrator/templates /opt/orchestrator/configs \
+         /opt/orchestrator/tools /opt/orchestrator/visualizer
 
 # Install system dependencies
 echo "Installing system dependencies..."
@@ -338,30 +336,91 @@ Generates Docker Compose configurations for nested membrane hierarchies
 """
 
 import json
-import yaml
 import argparse
+import hashlib
 import os
-from typing import Dict, List, Any
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional
+
+# orjson is optional - parses config bytes through its C decoder when
+# installed; stdlib-only hosts fall back to the json module
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Compose/k8s env values are lowercase strings; a two-entry table turns
+# the per-membrane conditional into a single dict hit on two interned
+# constants
+_BOOL_STR = {True: 'true', False: 'false'}
+
+@dataclass(slots=True, frozen=True)
+class MembraneSpec:
+    """One membrane in the hierarchy
+
+    Slotted and frozen: fixed attribute slots instead of a per-record
+    dict, and immutable since hierarchy links are tracked on the
+    orchestrator rather than mutated into the record.
+    """
+    id: str
+    parent: Optional[str] = None
+    enable_scheme: bool = True
+    enable_monitoring: bool = True
 
 class MembraneOrchestrator:
+    # Parsed configs keyed by (path, mtime, size) - repeated loads of an
+    # unchanged file (e.g. generating compose then deploying) skip the
+    # read and parse entirely
+    _config_cache: Dict[tuple, Dict[str, Any]] = {}
+
     def __init__(self, max_depth: int = 3):
         self.max_depth = max_depth
-        self.membranes = {}
-        
-    def add_membrane(self, membrane_id: str, parent_id: str = None, 
+        self.membranes: Dict[str, MembraneSpec] = {}
+
+    def add_membrane(self, membrane_id: str, parent_id: str = None,
                     enable_scheme: bool = True, enable_monitoring: bool = True):
         """Add a membrane to the hierarchy"""
-        self.membranes[membrane_id] = {
-            'id': membrane_id,
-            'parent': parent_id,
-            'enable_scheme': enable_scheme,
-            'enable_monitoring': enable_monitoring,
-            'children': []
-        }
-        
-        if parent_id and parent_id in self.membranes:
-            self.membranes[parent_id]['children'].append(membrane_id)
-    
+        self.membranes[membrane_id] = MembraneSpec(
+            id=membrane_id,
+            parent=parent_id,
+            enable_scheme=enable_scheme,
+            enable_monitoring=enable_monitoring,
+        )
+
+    def _topological_order(self) -> List[str]:
+        """Order membranes parents-first (Kahn's algorithm)
+
+        The adjacency map is derived here, after all membranes are
+        added, so it is independent of config order (a child declared
+        before its parent still gets its edge). Config order no longer
+        matters: services are emitted so every depends_on target
+        precedes its dependents. Membranes whose parent is absent from
+        the config count as roots, and a cycle (malformed config) falls
+        back to insertion order for the remainder instead of dropping
+        services.
+        """
+        children: Dict[str, List[str]] = {}
+        roots = []
+        for membrane_id, spec in self.membranes.items():
+            if spec.parent in self.membranes:
+                children.setdefault(spec.parent, []).append(membrane_id)
+            else:
+                roots.append(membrane_id)
+
+        order = []
+        queue = deque(roots)
+        while queue:
+            membrane_id = queue.popleft()
+            order.append(membrane_id)
+            queue.extend(children.get(membrane_id, ()))
+
+        if len(order) != len(self.membranes):
+            visited = set(order)
+            order.extend(m for m in self.membranes if m not in visited)
+        return order
+
     def generate_compose(self) -> Dict[str, Any]:
         """Generate Docker Compose configuration"""
         compose = {
@@ -376,7 +435,8 @@ class MembraneOrchestrator:
             }
         }
         
-        for membrane_id, config in self.membranes.items():
+        for membrane_id in self._topological_order():
+            spec = self.membranes[membrane_id]
             service_name = f"membrane-{membrane_id}"
             compose['services'][service_name] = {
                 'build': {
@@ -385,9 +445,9 @@ class MembraneOrchestrator:
                 },
                 'environment': [
                     f"MEMBRANE_ID={membrane_id}",
-                    f"PARENT_MEMBRANE={config['parent'] or ''}",
-                    f"ENABLE_SCHEME={'true' if config['enable_scheme'] else 'false'}",
-                    f"ENABLE_MONITORING={'true' if config['enable_monitoring'] else 'false'}"
+                    f"PARENT_MEMBRANE={spec.parent or ''}",
+                    f"ENABLE_SCHEME={_BOOL_STR[bool(spec.enable_scheme)]}",
+                    f"ENABLE_MONITORING={_BOOL_STR[bool(spec.enable_monitoring)]}"
                 ],
                 'volumes': [
                     'membrane-comm:/opt/membrane/communication',
@@ -395,17 +455,27 @@ class MembraneOrchestrator:
                 ],
                 'networks': ['membrane-net']
             }
-            
-            if config['parent']:
-                compose['services'][service_name]['depends_on'] = [f"membrane-{config['parent']}"]
+
+            # Only reference parents that actually exist in the config;
+            # a dangling depends_on fails docker-compose outright
+            if spec.parent in self.membranes:
+                compose['services'][service_name]['depends_on'] = [f"membrane-{spec.parent}"]
         
         return compose
     
     def load_from_json(self, config_path: str):
         """Load membrane hierarchy from JSON config"""
-        with open(config_path, 'r') as f:
-            config = json.load(f)
-        
+        stat = os.stat(config_path)
+        cache_key = (os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)
+        config = self._config_cache.get(cache_key)
+        if config is None:
+            # Binary one-shot read: skips the TextIOWrapper decoding
+            # layer and its extra stat/seek syscalls, and json/orjson
+            # decode bytes directly
+            with open(config_path, 'rb') as f:
+                config = _json_loads(f.read())
+            self._config_cache[cache_key] = config
+
         for membrane in config.get('membranes', []):
             self.add_membrane(
                 membrane['id'],
@@ -414,23 +484,59 @@ class MembraneOrchestrator:
                 membrane.get('enable_monitoring', True)
             )
 
-if __name__ == '__main__':
+def _config_digest(config_path: str, max_depth: int) -> str:
+    """Content hash of the config plus the options that shape the output"""
+    with open(config_path, 'rb') as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16)
+    digest.update(str(max_depth).encode())
+    return digest.hexdigest()
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; reusable by library/test callers"""
     parser = argparse.ArgumentParser(description='Generate Docker Compose for P-System Membranes')
     parser.add_argument('--config', required=True, help='JSON configuration file')
     parser.add_argument('--output', default='docker-compose.yml', help='Output file')
     parser.add_argument('--max-depth', type=int, default=3, help='Maximum nesting depth')
-    
-    args = parser.parse_args()
-    
-    orchestrator = MembraneOrchestrator(args.max_depth)
-    orchestrator.load_from_json(args.config)
-    
-    compose = orchestrator.generate_compose()
-    
-    with open(args.output, 'w') as f:
-        yaml.dump(compose, f, default_flow_style=False, sort_keys=False)
-    
-    print(f"Generated Docker Compose configuration: {args.output}")
+    return parser
+
+_PARSER = _build_parser()
+
+if __name__ == '__main__':
+    args = _PARSER.parse_args()
+
+    # Skip regeneration when the config hasn't changed since the output
+    # was last written - repeated generate/deploy cycles become a hash
+    # check instead of a full parse + YAML dump
+    key = _config_digest(args.config, args.max_depth)
+    key_file = args.output + '.cache-key'
+    cached_key = None
+    if os.path.exists(args.output):
+        try:
+            with open(key_file) as f:
+                cached_key = f.read().strip()
+        except OSError:
+            pass
+
+    if cached_key == key:
+        print(f"Docker Compose configuration unchanged: {args.output}")
+    else:
+        orchestrator = MembraneOrchestrator(args.max_depth)
+        orchestrator.load_from_json(args.config)
+
+        compose = orchestrator.generate_compose()
+
+        # PyYAML is imported only when there is something to dump: the
+        # cache-hit path above and library imports skip its resolver-
+        # regex compilation entirely
+        import yaml
+        with open(args.output, 'w') as f:
+            yaml.dump(compose, f,
+                      Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper),
+                      default_flow_style=False, sort_keys=False)
+        with open(key_file, 'w') as f:
+            f.write(key)
+
+        print(f"Generated Docker Compose configuration: {args.output}")
 EOF
 
 chmod +x /opt/orchestrator/tools/membrane-compose.py
@@ -444,15 +550,40 @@ Automatically discovers and orchestrates membranes from the distributed registry
 """
 
 import json
+import os
 import requests
 import argparse
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
 
+# orjson is optional - its C decoder is markedly faster than the stdlib
+# for large discovery responses. Hosts with stdlib-only python3 fall
+# back to requests' own JSON decoding.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# libyaml's C emitter when available - several times faster than the
+# pure-Python default; everything dumped here is plain dicts, so
+# SafeDumper semantics are all that's needed
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Invariant manifest fragments, built once and referenced per membrane.
+# Nothing mutates generated manifests and each fragment appears at most
+# once per YAML document, so sharing them emits no anchors/aliases.
+_CONTAINER_PORTS = [{'containerPort': 8080}]
+_SERVICE_PORTS = [{'port': 8080, 'targetPort': 8080}]
+
 class RegistryOrchestrator:
     def __init__(self, registry_url: str = "http://localhost:8500"):
         self.registry_url = registry_url.rstrip('/')
-        
+        # Active-membrane lists per namespace, fetched once per
+        # orchestrator instance - generating compose and k8s outputs in
+        # the same run hits the registry a single time
+        self._membrane_cache: Dict[Any, List[Dict]] = {}
+
     def discover_membranes(self, namespace_id: str = None) -> List[Dict]:
         """Discover registered membranes from registry"""
         params = {}
@@ -462,15 +593,41 @@ class RegistryOrchestrator:
         try:
             response = requests.get(f"{self.registry_url}/api/membranes/discover", params=params)
             response.raise_for_status()
+            if orjson is not None:
+                return orjson.loads(response.content)['membranes']
             return response.json()['membranes']
         except requests.RequestException as e:
             print(f"Failed to discover membranes: {e}")
             return []
-    
+
+    def _active_membranes(self, namespace_id: str = None) -> List[Dict]:
+        """Discover once and filter to active membranes, cached per namespace"""
+        membranes = self._membrane_cache.get(namespace_id)
+        if membranes is None:
+            membranes = [m for m in self.discover_membranes(namespace_id)
+                         if m['status'] == 'active']
+            self._membrane_cache[namespace_id] = membranes
+        return membranes
+
+    def _membrane_env(self, membrane: Dict) -> List[tuple]:
+        """Environment for one membrane as (name, value) pairs
+
+        Structured at the source: the compose path formats NAME=VALUE
+        strings and the k8s path builds name/value dicts, and neither
+        ever re-parses the other's representation.
+        """
+        return [
+            ('MEMBRANE_ID', membrane['membrane_id']),
+            ('PARENT_MEMBRANE', membrane['parent_membrane'] or ''),
+            ('REGISTRY_URL', self.registry_url),
+            ('NAMESPACE_ID', membrane['namespace_id']),
+            ('ENABLE_REGISTRY', 'true'),
+        ]
+
     def generate_dynamic_compose(self, namespace_id: str = None) -> Dict[str, Any]:
         """Generate Docker Compose from discovered membranes"""
-        membranes = self.discover_membranes(namespace_id)
-        
+        membranes = self._active_membranes(namespace_id)
+
         if not membranes:
             print("No membranes discovered from registry")
             return {}
@@ -487,72 +644,87 @@ class RegistryOrchestrator:
             }
         }
         
+        # Every active service name, known up front: parent checks stop
+        # depending on iteration order (a child listed before its parent
+        # previously lost its depends_on edge) and become set hits
+        # instead of service-dict scans
+        service_names = {f"membrane-{m['membrane_id']}" for m in membranes}
+
         for membrane in membranes:
-            if membrane['status'] != 'active':
-                continue
-                
-            service_name = f"membrane-{membrane['membrane_id']}"
-            compose['services'][service_name] = {
+            # Bind the repeated fields once per membrane instead of
+            # re-doing the dict lookups in every f-string below
+            membrane_id = membrane['membrane_id']
+            namespace = membrane['namespace_id']
+            parent = membrane['parent_membrane']
+
+            service_name = f"membrane-{membrane_id}"
+            service = {
                 'image': 'membrane:latest',
-                'environment': [
-                    f"MEMBRANE_ID={membrane['membrane_id']}",
-                    f"PARENT_MEMBRANE={membrane['parent_membrane'] or ''}",
-                    f"REGISTRY_URL={self.registry_url}",
-                    f"NAMESPACE_ID={membrane['namespace_id']}",
-                    "ENABLE_REGISTRY=true"
-                ],
+                'environment': [f"{name}={value}"
+                                for name, value in self._membrane_env(membrane)],
                 'volumes': [
                     'membrane-comm:/opt/membrane/communication',
                     'membrane-state:/opt/membrane/state'
                 ],
                 'networks': ['membrane-net'],
                 'labels': [
-                    f"membrane.id={membrane['membrane_id']}",
-                    f"membrane.namespace={membrane['namespace_id']}",
+                    f"membrane.id={membrane_id}",
+                    f"membrane.namespace={namespace}",
                     "membrane.registry=true"
                 ]
             }
-            
+
             # Add dependency on parent if it exists
-            if membrane['parent_membrane']:
-                parent_service = f"membrane-{membrane['parent_membrane']}"
-                if parent_service in compose['services']:
-                    compose['services'][service_name]['depends_on'] = [parent_service]
+            if parent:
+                parent_service = f"membrane-{parent}"
+                if parent_service in service_names:
+                    service['depends_on'] = [parent_service]
+
+            compose['services'][service_name] = service
         
         return compose
     
     def generate_kubernetes_manifests(self, namespace_id: str = None) -> List[Dict]:
         """Generate Kubernetes manifests from discovered membranes"""
-        membranes = self.discover_membranes(namespace_id)
-        manifests = []
-        
+        return list(self.iter_kubernetes_manifests(namespace_id))
+
+    def iter_kubernetes_manifests(self, namespace_id: str = None):
+        """Yield manifests one at a time
+
+        Generator form so streaming consumers hold a single manifest in
+        memory instead of the whole list.
+        """
+        membranes = self._active_membranes(namespace_id)
+
+        # Invariant across every manifest below - compute once
+        k8s_namespace = f"membrane-{namespace_id or 'default'}"
+
         # Add namespace
         namespace_manifest = {
             'apiVersion': 'v1',
             'kind': 'Namespace',
             'metadata': {
-                'name': f"membrane-{namespace_id or 'default'}",
+                'name': k8s_namespace,
                 'labels': {
                     'membrane.registry': 'true',
                     'membrane.namespace': namespace_id or 'default'
                 }
             }
         }
-        manifests.append(namespace_manifest)
-        
+        yield namespace_manifest
+
         for membrane in membranes:
-            if membrane['status'] != 'active':
-                continue
-                
+            membrane_id = membrane['membrane_id']
+
             # Deployment manifest
             deployment = {
                 'apiVersion': 'apps/v1',
                 'kind': 'Deployment',
                 'metadata': {
-                    'name': f"membrane-{membrane['membrane_id']}",
-                    'namespace': f"membrane-{namespace_id or 'default'}",
+                    'name': f"membrane-{membrane_id}",
+                    'namespace': k8s_namespace,
                     'labels': {
-                        'membrane.id': membrane['membrane_id'],
+                        'membrane.id': membrane_id,
                         'membrane.registry': 'true'
                     }
                 },
@@ -560,13 +732,13 @@ class RegistryOrchestrator:
                     'replicas': 1,
                     'selector': {
                         'matchLabels': {
-                            'membrane.id': membrane['membrane_id']
+                            'membrane.id': membrane_id
                         }
                     },
                     'template': {
                         'metadata': {
                             'labels': {
-                                'membrane.id': membrane['membrane_id'],
+                                'membrane.id': membrane_id,
                                 'membrane.registry': 'true'
                             }
                         },
@@ -574,64 +746,87 @@ class RegistryOrchestrator:
                             'containers': [{
                                 'name': 'membrane',
                                 'image': 'membrane:latest',
-                                'env': [
-                                    {'name': 'MEMBRANE_ID', 'value': membrane['membrane_id']},
-                                    {'name': 'PARENT_MEMBRANE', 'value': membrane['parent_membrane'] or ''},
-                                    {'name': 'REGISTRY_URL', 'value': self.registry_url},
-                                    {'name': 'NAMESPACE_ID', 'value': membrane['namespace_id']},
-                                    {'name': 'ENABLE_REGISTRY', 'value': 'true'}
-                                ],
-                                'ports': [{'containerPort': 8080}]
+                                'env': [{'name': name, 'value': value}
+                                        for name, value in self._membrane_env(membrane)],
+                                'ports': _CONTAINER_PORTS
                             }]
                         }
                     }
                 }
             }
-            manifests.append(deployment)
+            yield deployment
             
             # Service manifest
             service = {
                 'apiVersion': 'v1',
                 'kind': 'Service',
                 'metadata': {
-                    'name': f"membrane-{membrane['membrane_id']}-service",
-                    'namespace': f"membrane-{namespace_id or 'default'}"
+                    'name': f"membrane-{membrane_id}-service",
+                    'namespace': k8s_namespace
                 },
                 'spec': {
                     'selector': {
-                        'membrane.id': membrane['membrane_id']
+                        'membrane.id': membrane_id
                     },
-                    'ports': [{'port': 8080, 'targetPort': 8080}]
+                    'ports': _SERVICE_PORTS
                 }
             }
-            manifests.append(service)
-        
-        return manifests
+            yield service
 
-if __name__ == '__main__':
+    def write_kubernetes_manifests(self, fp, namespace_id: str = None):
+        """Stream generated manifests straight to an open file
+
+        Small outputs take the single-pass yaml.dump_all path, which
+        writes each document into fp as it is emitted. Large
+        architectures serialize documents on a thread pool first: the
+        libyaml emitter releases the GIL, so per-document dumps scale
+        with cores (pure-Python fallback dumper stays sequential -
+        threads would only add overhead under the GIL).
+        """
+        manifests = self.iter_kubernetes_manifests(namespace_id)
+        if (len(self._active_membranes(namespace_id)) >= 32
+                and _YAML_DUMPER is not yaml.SafeDumper):
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+                for document in pool.map(self._dump_manifest, manifests):
+                    fp.write(document)
+        else:
+            yaml.dump_all(manifests, fp,
+                          Dumper=_YAML_DUMPER, explicit_start=True,
+                          default_flow_style=False, sort_keys=False)
+
+    @staticmethod
+    def _dump_manifest(manifest: Dict) -> str:
+        """Serialize one manifest as its own explicit-start document"""
+        return '---\n' + yaml.dump(manifest, Dumper=_YAML_DUMPER,
+                                   default_flow_style=False, sort_keys=False)
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once; reusable by library/test callers"""
     parser = argparse.ArgumentParser(description='Registry-Aware P-System Orchestrator')
     parser.add_argument('--registry-url', default='http://localhost:8500', help='Registry URL')
     parser.add_argument('--namespace', help='Target namespace ID')
     parser.add_argument('--output-format', choices=['compose', 'kubernetes'], default='compose')
     parser.add_argument('--output', default='output.yml', help='Output file')
-    
-    args = parser.parse_args()
+    return parser
+
+_PARSER = _build_parser()
+
+if __name__ == '__main__':
+    args = _PARSER.parse_args()
     
     orchestrator = RegistryOrchestrator(args.registry_url)
     
     if args.output_format == 'compose':
         config = orchestrator.generate_dynamic_compose(args.namespace)
         with open(args.output, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
         print(f"Generated Docker Compose from registry: {args.output}")
-    
+
     elif args.output_format == 'kubernetes':
-        manifests = orchestrator.generate_kubernetes_manifests(args.namespace)
-        with open(args.output, 'w') as f:
-            for i, manifest in enumerate(manifests):
-                if i > 0:
-                    f.write("---\n")
-                yaml.dump(manifest, f, default_flow_style=False, sort_keys=False)
+        # Wide write buffer so the streamed documents hit the disk in
+        # large chunks rather than one write per emitter flush
+        with open(args.output, 'w', buffering=1 << 20) as f:
+            orchestrator.write_kubernetes_manifests(f, args.namespace)
         print(f"Generated Kubernetes manifests from registry: {args.output}")
 EOF
 
@@ -793,7 +988,9 @@ case "${1:-}" in
         compose_file="${2:-docker-compose.yml}"
         if [ -f "$compose_file" ]; then
             echo "Deploying membrane hierarchy..."
-            docker-compose -f "$compose_file" up -d
+            # Nothing runs after this; exec replaces the shell instead
+            # of keeping it alive just to wait on docker-compose
+            exec docker-compose -f "$compose_file" up -d
         else
             echo "Error: Compose file not found: $compose_file"
             exit 1
@@ -803,7 +1000,7 @@ case "${1:-}" in
         compose_file="${2:-docker-compose.yml}"
         if [ -f "$compose_file" ]; then
             echo "Tearing down membrane hierarchy..."
-            docker-compose -f "$compose_file" down -v
+            exec docker-compose -f "$compose_file" down -v
         else
             echo "Error: Compose file not found: $compose_file"
             exit 1
@@ -861,7 +1058,7 @@ case "${1:-}" in
         else
             python3 /opt/orchestrator/tools/registry-orchestrator.py --registry-url "$registry_url" --output-format compose --output registry-compose.yml
         fi
-        docker-compose -f registry-compose.yml up -d
+        exec docker-compose -f registry-compose.yml up -d
         ;;
     "kubernetes-from-registry")
         registry_url="${2:-http://localhost:8500}"